@@ -157,9 +157,11 @@ class AudioClip(Clip):
         snd_array = self.get_frame(tt)
 
         if quantize:
-            snd_array = np.maximum(-0.99, np.minimum(0.99, snd_array))
             inttype = {1: "int8", 2: "int16", 4: "int32"}[nbytes]
-            snd_array = (2 ** (8 * nbytes - 1) * snd_array).astype(inttype)
+            # the clipped array is a new one, so it can be scaled in place
+            snd_array = np.clip(snd_array, -0.99, 0.99)
+            snd_array *= 2 ** (8 * nbytes - 1)
+            snd_array = snd_array.astype(inttype)
 
         return snd_array
 
@@ -183,11 +185,12 @@ class AudioClip(Clip):
         filename,
         fps=None,
         nbytes=2,
-        buffersize=2000,
+        buffersize=5000,
         codec=None,
         bitrate=None,
         ffmpeg_params=None,
         write_logfile=False,
+        threads=None,
         logger="bar",
     ):
         """Writes an audio file from the AudioClip.
@@ -206,6 +209,11 @@ class AudioClip(Clip):
         nbytes
           Sample width (set to 2 for 16-bit sound, 4 for 32-bit sound)
 
+        buffersize
+          Number of frames computed and written at once. Values lower than
+          a tenth of ``fps`` (100 ms of audio) are raised to that, so the
+          default only applies up to 50000 frames per second.
+
         codec
           Which audio codec should be used. If None provided, the codec is
           determined based on the extension of the filename. Choose
@@ -225,6 +233,10 @@ class AudioClip(Clip):
           If true, produces a detailed logfile named filename + '.log'
           when writing the file
 
+        threads
+          Number of threads used by ffmpeg to encode the audio. By default
+          ffmpeg chooses according to the number of CPUs.
+
         logger
           Either ``"bar"`` for progress bar or ``None`` or any Proglog logger.
 
@@ -256,6 +268,7 @@ class AudioClip(Clip):
             bitrate=bitrate,
             write_logfile=write_logfile,
             ffmpeg_params=ffmpeg_params,
+            threads=threads,
             logger=logger,
         )
 
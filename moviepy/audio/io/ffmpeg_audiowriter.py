@@ -1,7 +1,17 @@
 """MoviePy audio writing with ffmpeg."""
 
+import contextlib
+import errno
+import os
+import queue
+import stat
 import subprocess as sp
+import sys
+import threading
+import time
+import warnings
 
+import numpy as np
 import proglog
 
 from moviepy.config import FFMPEG_BINARY
@@ -9,6 +19,154 @@ from moviepy.decorators import requires_duration
 from moviepy.tools import cross_platform_popen_params
 
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+try:
+    import liburing
+except ImportError:  # pragma: no cover
+    liburing = None
+
+# ``F_SETPIPE_SZ`` is only exposed by the ``fcntl`` module from Python 3.10,
+# but the constant is stable on Linux
+F_SETPIPE_SZ = getattr(fcntl, "F_SETPIPE_SZ", 1031)
+
+# size of the buffer wrapping the ffmpeg stdin pipe, and of the pipe itself
+PIPE_BUFFER_SIZE = 1024 * 1024
+
+# size requested for the named pipes created by `FFMPEG_AudioWriter.from_fifo`,
+# above the default limit for unprivileged users (`PIPE_BUFFER_SIZE` is used
+# then)
+FIFO_BUFFER_SIZE = 256 * 1024 * 1024
+
+# with io_uring, the chunks are accumulated by the writer up to this size
+MIN_WRITE_SIZE = 64 * 1024
+
+# only the end of the ffmpeg output is kept, as it reports the error if any
+MAX_STDERR_SIZE = 64 * 1024
+
+# minimum duration, in seconds, of the chunks computed by `ffmpeg_audiowrite`
+MIN_CHUNK_DURATION = 0.1
+
+# On POSIX systems the writer owns the buffering, so the stdin pipe is left
+# unbuffered: the chunks are copied in a buffer of up to `PIPE_BUFFER_SIZE`
+# bytes, which is written along with the next chunk that does not fit in it,
+# with a single vectored write. Elsewhere the stdin pipe is wrapped in a buffer
+# of `PIPE_BUFFER_SIZE` bytes.
+HAS_WRITEV = hasattr(os, "writev")
+
+
+def _set_pipe_size(fd, size):
+    """Tries to enlarge the kernel buffer of the pipe ``fd`` to ``size`` bytes.
+
+    Only supported on Linux, where the default pipe capacity is 64 KiB. Returns
+    ``False`` on other platforms or if the size is above the system limit.
+    """
+    if fcntl is None or not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.fcntl(fd, F_SETPIPE_SZ, size)
+    except OSError:
+        return False
+    return True
+
+
+def _read_stderr(stderr, buffer):
+    """Reads the ffmpeg output ``stderr`` into the bytearray ``buffer`` until
+    ffmpeg exits, only keeping its last ``MAX_STDERR_SIZE`` bytes.
+
+    It does not reference the writer, so a writer dropped without being
+    closed can still be garbage collected while this runs in a thread.
+    """
+    fd = stderr.fileno()  # stderr may be buffered or not, see `HAS_WRITEV`
+    for data in iter(lambda: os.read(fd, 65536), b""):
+        buffer.extend(data)
+        if len(buffer) > MAX_STDERR_SIZE:
+            del buffer[:-MAX_STDERR_SIZE]
+
+
+def _write_all(fd, data):
+    """Writes all ``data`` to the file descriptor ``fd``."""
+    data = memoryview(data)
+    while data:
+        data = data[os.write(fd, data) :]
+
+
+class UringPipeWriter:
+    """Writes data to a pipe through an io_uring submission queue (Linux only,
+    requires the ``liburing`` package).
+
+    The writes are queued and only submitted, with a single system call, once
+    ``depth`` of them are pending or when ``flush`` is called. They are linked
+    so the kernel performs them in order.
+
+    Parameters
+    ----------
+
+    fd : int
+      File descriptor of the pipe.
+
+    depth : int, optional
+      Number of writes submitted together.
+    """
+
+    def __init__(self, fd, depth=8):
+        self.fd = fd
+        self.depth = depth
+        self._ring = liburing.Ring()
+        self._cqe = liburing.Cqe()
+        liburing.io_uring_queue_init(depth, self._ring)
+        # the queued buffers must be kept alive until their write is complete
+        self._queued = []
+
+    def write(self, data):
+        """Queues a write of ``data``, a ``bytes`` or ``bytearray`` that must
+        not be modified afterwards.
+        """
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_write(sqe, self.fd, data, 0)
+        sqe.flags |= liburing.IOSQE_IO_LINK
+        sqe.user_data = len(self._queued)
+        self._queued.append(data)
+        if len(self._queued) >= self.depth:
+            self.flush()
+
+    def flush(self):
+        """Submits the queued writes and waits for their completion."""
+        if not self._queued:
+            return
+        buffers, self._queued = self._queued, []
+        liburing.io_uring_submit(self._ring)
+        results = [None] * len(buffers)
+        for _ in buffers:
+            liburing.io_uring_wait_cqe(self._ring, self._cqe)
+            cqe = self._cqe[0]
+            results[cqe.user_data] = cqe.res
+            liburing.io_uring_cqe_seen(self._ring, cqe)
+
+        # A short write cancels the writes linked after it, so the remaining
+        # data is written synchronously, in order.
+        for i, (data, result) in enumerate(zip(buffers, results)):
+            if result < 0 and result != -errno.ECANCELED:
+                raise OSError(-result, os.strerror(-result))
+            if result < 0 or result < len(data):
+                _write_all(self.fd, memoryview(data)[max(result, 0) :])
+                for data in buffers[i + 1 :]:
+                    _write_all(self.fd, data)
+                break
+
+    def close(self):
+        """Writes the queued data and releases the ring."""
+        if self._ring is not None:
+            try:
+                self.flush()
+            finally:
+                liburing.io_uring_queue_exit(self._ring)
+                self._ring = None
+
+
 class FFMPEG_AudioWriter:
     """
     A class to write an AudioClip into an audio file.
@@ -33,6 +191,20 @@ class FFMPEG_AudioWriter:
       A string indicating the bitrate of the final video. Only
       relevant for codecs which accept a bitrate.
 
+    threads
+      Number of threads used by ffmpeg to encode the audio. If not set,
+      ``0`` is passed to let ffmpeg choose according to the number of CPUs.
+      Codecs that do not support multithreading ignore it.
+
+    use_uring
+      If ``True``, the data is written to ffmpeg through io_uring with a
+      ``UringPipeWriter``. Only available on Linux with the ``liburing``
+      package installed, a warning is emitted otherwise.
+
+    fifo_path
+      Path of an existing named pipe (FIFO) from which ffmpeg reads the audio,
+      instead of its stdin. See ``FFMPEG_AudioWriter.from_fifo``.
+
     """
 
     def __init__(
@@ -46,13 +218,22 @@ class FFMPEG_AudioWriter:
         input_video=None,
         logfile=None,
         ffmpeg_params=None,
+        threads=None,
+        use_uring=False,
+        fifo_path=None,
     ):
         if logfile is None:
             logfile = sp.PIPE
         self.logfile = logfile
         self.filename = filename
         self.codec = codec
+        self.nbytes = nbytes
         self.ext = self.filename.split(".")[-1]
+        self.fifo_path = fifo_path
+        self._remove_fifo = False
+
+        sample_format = f"s{8 * nbytes}le"
+        sample_rate = str(int(fps_input))
 
         # order is important
         cmd = [
@@ -61,103 +242,336 @@ class FFMPEG_AudioWriter:
             "-loglevel",
             "error" if logfile == sp.PIPE else "info",
             "-f",
-            "s%dle" % (8 * nbytes),
+            sample_format,
             "-acodec",
-            "pcm_s%dle" % (8 * nbytes),
+            f"pcm_{sample_format}",
             "-ar",
-            "%d" % fps_input,
+            sample_rate,
             "-ac",
-            "%d" % nchannels,
+            str(int(nchannels)),
             "-i",
-            "-",
+            "-" if fifo_path is None else fifo_path,
         ]
         if input_video is None:
-            cmd.extend(["-vn"])
+            cmd.append("-vn")
         else:
             cmd.extend(["-i", input_video, "-vcodec", "copy"])
 
-        cmd.extend(["-acodec", codec] + ["-ar", "%d" % fps_input])
+        cmd.extend(["-acodec", codec, "-ar", sample_rate])
+        cmd.extend(["-threads", str(0 if threads is None else threads)])
         cmd.extend(["-strict", "-2"])  # needed to support codec 'aac'
         if bitrate is not None:
             cmd.extend(["-ab", bitrate])
         if ffmpeg_params is not None:
             cmd.extend(ffmpeg_params)
-        cmd.extend([filename])
+        cmd.append(filename)
 
+        # no buffering when the chunks are accumulated for `os.writev`
+        stdin_buffer_size = 0 if HAS_WRITEV else PIPE_BUFFER_SIZE
         popen_params = cross_platform_popen_params(
-            {"stdout": sp.DEVNULL, "stderr": logfile, "stdin": sp.PIPE}
+            {
+                "stdout": sp.DEVNULL,
+                "stderr": logfile,
+                "stdin": sp.PIPE if fifo_path is None else sp.DEVNULL,
+                "bufsize": stdin_buffer_size,
+            }
         )
 
         self.proc = sp.Popen(cmd, **popen_params)
 
+        # The ffmpeg output is read continuously, otherwise ffmpeg would block
+        # once the stderr pipe is full, while we block writing to its stdin.
+        self._stderr_data = bytearray()
+        self._stderr_reader = None
+        if self.proc.stderr is not None:
+            self._stderr_reader = threading.Thread(
+                target=_read_stderr,
+                args=(self.proc.stderr, self._stderr_data),
+                daemon=True,
+            )
+            self._stderr_reader.start()
+
+        self._coalesce = bytearray()
+        self._buffer = None
+        self._uring = None
+
+        if fifo_path is None:
+            _set_pipe_size(self.proc.stdin.fileno(), PIPE_BUFFER_SIZE)
+        else:
+            # the writer then handles the FIFO like the stdin pipe
+            self.proc.stdin = self._open_fifo(fifo_path, stdin_buffer_size)
+        # descriptor of the pipe, written directly by `_write_pending`
+        self._stdin_fd = self.proc.stdin.fileno()
+
+        if use_uring:
+            if liburing is None:
+                warnings.warn(
+                    "MoviePy: io_uring is not available (install 'liburing'), "
+                    "the audio will be written with regular writes.",
+                    UserWarning,
+                )
+            else:
+                try:
+                    self._uring = UringPipeWriter(self._stdin_fd)
+                except (AttributeError, OSError) as err:
+                    warnings.warn(
+                        f"MoviePy: io_uring could not be set up ({err}), "
+                        "the audio will be written with regular writes.",
+                        UserWarning,
+                    )
+
+    @classmethod
+    def from_fifo(cls, fifo_path, filename, fps_input, **kwargs):
+        """Returns a writer whose ffmpeg process reads the audio from the named
+        pipe ``fifo_path`` rather than from its stdin (POSIX only).
+
+        The named pipe is created if it does not exist, and then removed when
+        the writer is closed. A ``ValueError`` is raised if ``fifo_path`` is
+        another kind of file. Other processes, like another ffmpeg, can also
+        write to it, so the data does not go through Python. On Linux, the
+        pipe capacity is raised up to ``FIFO_BUFFER_SIZE`` bytes if allowed.
+
+        The other arguments are the ones of ``FFMPEG_AudioWriter``.
+        """
+        if not hasattr(os, "mkfifo"):
+            raise IOError("MoviePy: named pipes are not supported on this platform")
+        created = not os.path.exists(fifo_path)
+        if created:
+            os.mkfifo(fifo_path)
+        elif not stat.S_ISFIFO(os.stat(fifo_path).st_mode):
+            raise ValueError(f"MoviePy: {fifo_path} is not a named pipe")
+        try:
+            writer = cls(filename, fps_input, fifo_path=fifo_path, **kwargs)
+        except BaseException:
+            if created:
+                os.remove(fifo_path)
+            raise
+        writer._remove_fifo = created
+        return writer
+
+    def _open_fifo(self, fifo_path, buffer_size):
+        """Opens the named pipe for writing, once ffmpeg has opened it for
+        reading, and returns it as a file with a buffer of ``buffer_size``
+        bytes.
+        """
+        while True:
+            try:
+                # a blocking open would wait forever if ffmpeg fails to start
+                fd = os.open(fifo_path, os.O_WRONLY | os.O_NONBLOCK)
+                break
+            except OSError as err:
+                if err.errno != errno.ENXIO:  # ENXIO: no reader yet
+                    proc, self.proc = self.proc, None
+                    proc.kill()
+                    proc.wait()
+                    self._close_stderr(proc)
+                    raise
+            if self.proc.poll() is not None:
+                self._raise_ffmpeg_error(
+                    f"FFMPEG exited before reading the named pipe {fifo_path}"
+                )
+            time.sleep(0.01)
+        os.set_blocking(fd, True)
+        if not _set_pipe_size(fd, FIFO_BUFFER_SIZE):
+            _set_pipe_size(fd, PIPE_BUFFER_SIZE)
+        return open(fd, "wb", buffering=buffer_size)
+
     def write_frames(self, frames_array):
-        """TODO: add documentation"""
+        """Writes a chunk of audio frames.
+
+        The frames must be quantized to signed integers of ``nbytes`` bytes,
+        as returned by ``AudioClip.iter_chunks(quantize=True, nbytes=nbytes)``.
+
+        The chunks are buffered and written together, the remaining data
+        being written by ``close``. The array is not referenced once this
+        returns, so it can be filled again for the next chunk.
+        """
+        # the raw bytes are sent to ffmpeg, which would misread other types
+        dtype = frames_array.dtype
+        assert (
+            dtype.kind == "i" and dtype.itemsize == self.nbytes
+        ), f"Expected {self.nbytes}-byte integer frames, got {dtype}"
+        if not frames_array.flags["C_CONTIGUOUS"]:
+            frames_array = self._copy_to_buffer(frames_array)
+        # a flat byte view of the array is written instead of a `tobytes()` copy
+        data = memoryview(frames_array.reshape(-1).view(np.uint8))
+        if self._uring is not None:
+            self._coalesce.extend(data)
+            if len(self._coalesce) >= MIN_WRITE_SIZE:
+                self._write_uring()
+            return
+        if HAS_WRITEV:
+            # The caller may modify the array once this returns, so it is
+            # either copied or written right away, never kept.
+            if len(self._coalesce) + len(data) < PIPE_BUFFER_SIZE:
+                self._coalesce.extend(data)
+            else:
+                self._write_pending(data)
+            return
+        # the stdin buffer batches the writes
+        self._write(data)
+
+    def _copy_to_buffer(self, frames_array):
+        """Returns a contiguous copy of ``frames_array`` stored in a buffer that
+        is reused by the next calls, and only reallocated to grow.
+        """
+        if self._buffer is None or len(self._buffer) < frames_array.nbytes:
+            self._buffer = bytearray(frames_array.nbytes)
+        copy = np.frombuffer(
+            self._buffer, dtype=frames_array.dtype, count=frames_array.size
+        ).reshape(frames_array.shape)
+        np.copyto(copy, frames_array)
+        return copy
+
+    def _write(self, data):
         try:
-            self.proc.stdin.write(frames_array.tobytes())
+            self.proc.stdin.write(data)
         except IOError as err:
-            _, ffmpeg_error = self.proc.communicate()
-            if ffmpeg_error is not None:
-                ffmpeg_error = ffmpeg_error.decode()
-            else:
-                # The error was redirected to a logfile with `write_logfile=True`,
-                # so read the error from that file instead
-                self.logfile.seek(0)
-                ffmpeg_error = self.logfile.read()
-
-            error = (
-                f"{err}\n\nMoviePy error: FFMPEG encountered the following error while "
-                f"writing file {self.filename}:\n\n {ffmpeg_error}"
-            )
+            self._raise_ffmpeg_error(err)
 
-            if "Unknown encoder" in ffmpeg_error:
-                error += (
-                    "\n\nThe audio export failed because FFMPEG didn't find the "
-                    f"specified codec for audio encoding {self.codec}. "
-                    "Please install this codec or change the codec when calling "
-                    "write_videofile or write_audiofile.\nFor instance for mp3:\n"
-                    "   >>> write_videofile('myvid.mp4', audio_codec='libmp3lame')"
-                )
+    def _write_uring(self):
+        # the ring takes ownership of the accumulated data
+        data, self._coalesce = self._coalesce, bytearray()
+        try:
+            self._uring.write(data)
+        except IOError as err:
+            self._raise_ffmpeg_error(err)
 
-            elif "incorrect codec parameters ?" in ffmpeg_error:
-                error += (
-                    "\n\nThe audio export failed, possibly because the "
-                    f"codec specified for the video {self.codec} is not compatible"
-                    f" with the given extension {self.ext}. Please specify a "
-                    "valid 'codec' argument in write_audiofile or 'audio_codoc'"
-                    "argument in write_videofile. This would be "
-                    "'libmp3lame' for mp3, 'libvorbis' for ogg..."
-                )
+    def _write_pending(self, data=None):
+        # The file descriptor is written directly, the stdin pipe being left
+        # unbuffered: on POSIX systems all the data goes through this method.
+        buffers = [self._coalesce] if data is None else [self._coalesce, data]
+        fd = self._stdin_fd
+        try:
+            start = 0
+            while start < len(buffers):
+                written = os.writev(fd, buffers[start:] if start else buffers)
+                # skip the fully written buffers and trim a partially written one
+                while start < len(buffers) and written >= len(buffers[start]):
+                    written -= len(buffers[start])
+                    start += 1
+                if written:
+                    buffers[start] = buffers[start][written:]
+        except IOError as err:
+            self._raise_ffmpeg_error(err)
+        finally:
+            self._coalesce.clear()
+
+    def _close_stderr(self, proc):
+        if self._stderr_reader is not None:
+            if proc.returncode is None:
+                return  # the reader thread stops by itself when ffmpeg exits
+            self._stderr_reader.join()
+        if proc.stderr is not None:
+            proc.stderr.close()
+            proc.stderr = None
+
+    def _raise_ffmpeg_error(self, err):
+        """Raises an ``IOError`` explaining why ffmpeg stopped accepting data.
+
+        The subprocess is waited for, so the writer is closed afterwards.
+        """
+        proc, self.proc = self.proc, None
+        if self._uring is not None:
+            with contextlib.suppress(IOError):  # the queued data is lost anyway
+                self._uring.close()
+        if proc.stdin is not None:
+            with contextlib.suppress(IOError):
+                proc.stdin.close()
+        proc.wait()
+        self._close_stderr(proc)
+        if self._stderr_reader is not None:
+            ffmpeg_error = bytes(self._stderr_data)
+        else:
+            # The error was redirected to a logfile with `write_logfile=True`,
+            # so read the error from that file instead
+            self.logfile.seek(0)
+            ffmpeg_error = self.logfile.read()
+        if isinstance(ffmpeg_error, bytes):
+            ffmpeg_error = ffmpeg_error.decode("utf8", errors="replace")
+
+        error = (
+            f"{err}\n\nMoviePy error: FFMPEG encountered the following error while "
+            f"writing file {self.filename}:\n\n {ffmpeg_error}"
+        )
 
-            elif "bitrate not specified" in ffmpeg_error:
-                error += (
-                    "\n\nThe audio export failed, possibly because the "
-                    "bitrate you specified was too high or too low for "
-                    "the audio codec."
-                )
+        if "Unknown encoder" in ffmpeg_error:
+            error += (
+                "\n\nThe audio export failed because FFMPEG didn't find the "
+                f"specified codec for audio encoding {self.codec}. "
+                "Please install this codec or change the codec when calling "
+                "write_videofile or write_audiofile.\nFor instance for mp3:\n"
+                "   >>> write_videofile('myvid.mp4', audio_codec='libmp3lame')"
+            )
 
-            elif "Invalid encoder type" in ffmpeg_error:
-                error += (
-                    "\n\nThe audio export failed because the codec "
-                    "or file extension you provided is not suitable for audio"
-                )
+        elif "incorrect codec parameters ?" in ffmpeg_error:
+            error += (
+                "\n\nThe audio export failed, possibly because the "
+                f"codec specified for the video {self.codec} is not compatible"
+                f" with the given extension {self.ext}. Please specify a "
+                "valid 'codec' argument in write_audiofile or 'audio_codoc'"
+                "argument in write_videofile. This would be "
+                "'libmp3lame' for mp3, 'libvorbis' for ogg..."
+            )
+
+        elif "bitrate not specified" in ffmpeg_error:
+            error += (
+                "\n\nThe audio export failed, possibly because the "
+                "bitrate you specified was too high or too low for "
+                "the audio codec."
+            )
+
+        elif "Invalid encoder type" in ffmpeg_error:
+            error += (
+                "\n\nThe audio export failed because the codec "
+                "or file extension you provided is not suitable for audio"
+            )
 
-            raise IOError(error)
+        raise IOError(error)
 
     def close(self):
         """Closes the writer, terminating the subprocess if is still alive."""
-        if hasattr(self, "proc") and self.proc:
-            self.proc.stdin.close()
-            self.proc.stdin = None
-            if self.proc.stderr is not None:
-                self.proc.stderr.close()
-                self.proc.stderr = None
-            # If this causes deadlocks, consider terminating instead.
-            self.proc.wait()
-            self.proc = None
+        try:
+            if hasattr(self, "proc") and self.proc:
+                try:
+                    if self.proc.stdin is not None:
+                        if self._uring is not None:
+                            if self._coalesce:
+                                self._write_uring()
+                            try:
+                                self._uring.close()
+                            except IOError as err:
+                                self._raise_ffmpeg_error(err)
+                        if self._coalesce:
+                            self._write_pending()
+                        # closing flushes the data still held in the stdin buffer
+                        stdin, self.proc.stdin = self.proc.stdin, None
+                        try:
+                            stdin.close()
+                        except IOError as err:
+                            self._raise_ffmpeg_error(err)
+                    # The buffered data may have been accepted by the pipe before
+                    # ffmpeg failed, so its exit status must be checked too.
+                    if self.proc.wait():
+                        self._raise_ffmpeg_error(
+                            f"FFMPEG exited with status {self.proc.returncode}"
+                        )
+                finally:
+                    if self.proc is not None:
+                        self._close_stderr(self.proc)
+                        self.proc = None
+        finally:
+            if getattr(self, "_remove_fifo", False):
+                self._remove_fifo = False
+                with contextlib.suppress(OSError):
+                    os.remove(self.fifo_path)
 
     def __del__(self):
         # If the garbage collector comes, make sure the subprocess is terminated.
-        self.close()
+        # An ffmpeg error can't be reported from here, `close` must be called
+        # explicitly to get it.
+        with contextlib.suppress(IOError):
+            self.close()
 
     # Support the Context Manager protocol, to ensure that resources are cleaned up.
 
@@ -168,6 +582,41 @@ class FFMPEG_AudioWriter:
         self.close()
 
 
+def _write_chunks(writer, chunks):
+    """Writes the audio ``chunks`` with ``writer`` from a separate thread.
+
+    This way the clip can compute the next chunks while the pipe is busy. The
+    queue is bounded to keep the memory usage under control if ffmpeg is the
+    bottleneck. Errors raised by the writer are raised back here.
+    """
+    queued_chunks = queue.Queue(maxsize=4)
+    errors = []
+
+    def write_queued_chunks():
+        while True:
+            chunk = queued_chunks.get()
+            if chunk is None:
+                return
+            if not errors:  # after an error the chunks are only drained
+                try:
+                    writer.write_frames(chunk)
+                except Exception as err:
+                    errors.append(err)
+
+    writer_thread = threading.Thread(target=write_queued_chunks, daemon=True)
+    writer_thread.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            queued_chunks.put(chunk)
+    finally:
+        queued_chunks.put(None)
+        writer_thread.join()
+    if errors:
+        raise errors[0]
+
+
 @requires_duration
 def ffmpeg_audiowrite(
     clip,
@@ -179,36 +628,56 @@ def ffmpeg_audiowrite(
     bitrate=None,
     write_logfile=False,
     ffmpeg_params=None,
+    threads=None,
     logger="bar",
 ):
     """
     A function that wraps the FFMPEG_AudioWriter to write an AudioClip
     to a file.
+
+    The clip is computed and written by chunks of ``buffersize`` frames, or of
+    ``MIN_CHUNK_DURATION`` seconds of audio if ``buffersize`` is lower.
     """
-    if write_logfile:
-        logfile = open(filename + ".log", "w+")
-    else:
-        logfile = None
     logger = proglog.default_bar_logger(logger)
+    min_buffersize = int(MIN_CHUNK_DURATION * fps)
+    if buffersize < min_buffersize:
+        logger.log(
+            f"MoviePy - Audio buffer size raised from {buffersize} to "
+            f"{min_buffersize} frames"
+        )
+        buffersize = min_buffersize
     logger(message="MoviePy - Writing audio in %s" % filename)
-    writer = FFMPEG_AudioWriter(
-        filename,
-        fps,
-        nbytes,
-        clip.nchannels,
-        codec=codec,
-        bitrate=bitrate,
-        logfile=logfile,
-        ffmpeg_params=ffmpeg_params,
-    )
-
-    for chunk in clip.iter_chunks(
-        chunksize=buffersize, quantize=True, nbytes=nbytes, fps=fps, logger=logger
-    ):
-        writer.write_frames(chunk)
 
-    writer.close()
+    # the writer and the logfile are closed even if the writing fails
+    with contextlib.ExitStack() as stack:
+        if write_logfile:
+            # ffmpeg writes its binary output straight to the file, which is
+            # only read and decoded back if an error occurs
+            logfile = stack.enter_context(open(filename + ".log", "wb+"))
+        else:
+            logfile = None
+        writer = stack.enter_context(
+            FFMPEG_AudioWriter(
+                filename,
+                fps,
+                nbytes,
+                clip.nchannels,
+                codec=codec,
+                bitrate=bitrate,
+                logfile=logfile,
+                ffmpeg_params=ffmpeg_params,
+                threads=threads,
+            )
+        )
+        _write_chunks(
+            writer,
+            clip.iter_chunks(
+                chunksize=buffersize,
+                quantize=True,
+                nbytes=nbytes,
+                fps=fps,
+                logger=logger,
+            ),
+        )
 
-    if write_logfile:
-        logfile.close()
     logger(message="MoviePy - Done.")
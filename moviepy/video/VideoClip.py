@@ -208,7 +208,7 @@ class VideoClip(Clip):
         audio_nbytes=4,
         audio_codec=None,
         audio_bitrate=None,
-        audio_bufsize=2000,
+        audio_bufsize=5000,
         temp_audiofile=None,
         temp_audiofile_path="",
         remove_temp=True,
@@ -265,6 +265,10 @@ class VideoClip(Clip):
         audio_fps
           frame rate to use when generating the sound.
 
+        audio_bufsize
+          Number of audio frames computed and written at once. Values lower
+          than a tenth of ``audio_fps`` (100 ms of audio) are raised to that.
+
         temp_audiofile
           the name of the temporary audiofile, as a string or path-like object,
           to be created and then used to write the complete video, if any.
@@ -1,3 +1,22 @@
+import numpy as np
+
+
+class _Crop:
+    """Frame transformation of the ``crop`` FX. Unlike a closure, it can be
+    pickled, for instance to render the frames in other processes.
+    """
+
+    __slots__ = ("x1", "y1", "x2", "y2", "copy")
+
+    def __init__(self, x1, y1, x2, y2, copy):
+        self.x1, self.y1, self.x2, self.y2 = x1, y1, x2, y2
+        self.copy = copy
+
+    def __call__(self, frame):
+        frame = frame[self.y1 : self.y2, self.x1 : self.x2]
+        return np.ascontiguousarray(frame) if self.copy else frame
+
+
 def crop(
     clip,
     x1=None,
@@ -8,6 +27,7 @@ def crop(
     height=None,
     x_center=None,
     y_center=None,
+    copy=False,
 ):
     """
     Returns a new clip in which just a rectangular subregion of the
@@ -37,7 +57,32 @@ def crop(
 
     >>> crop(clip, x_center=300, width=400, y1=100, y2=600)
 
+    Negative coordinates count from the right or bottom edge of the frame, as
+    in numpy slices:
+
+    >>> crop(clip, x1=-100)  # keep the last 100 columns
+
+    The parts of the rectangle outside of the frame, for instance when
+    ``x_center - width / 2`` is negative, are ignored. A ``ValueError`` is
+    raised if nothing is left to crop.
+
+    The frames of the new clip are views over the original frames. Set
+    ``copy=True`` to get contiguous copies instead, for instance if the cropped
+    clip is written right away, so the copy happens once and here. Leave it
+    to ``False`` when the crop is followed by other effects.
+
     """
+    w, h = clip.size
+    # explicit negative coordinates are resolved before the derived ones
+    if x1 is not None and x1 < 0:
+        x1 += w
+    if x2 is not None and x2 < 0:
+        x2 += w
+    if y1 is not None and y1 < 0:
+        y1 += h
+    if y2 is not None and y2 < 0:
+        y2 += h
+
     if width and x1 is not None:
         x2 = x1 + width
     elif width and x2 is not None:
@@ -59,6 +104,16 @@ def crop(
     x2 = x2 or clip.size[0]
     y2 = y2 or clip.size[1]
 
-    return clip.image_transform(
-        lambda frame: frame[int(y1) : int(y2), int(x1) : int(x2)], apply_to=["mask"]
-    )
+    # the bounds are converted once, not for every frame, and kept in the frame
+    x1, x2 = max(int(x1), 0), min(int(x2), w)
+    y1, y2 = max(int(y1), 0), min(int(y2), h)
+    if x2 <= x1 or y2 <= y1:
+        raise ValueError(
+            f"Empty crop rectangle: x1={x1}, y1={y1}, x2={x2}, y2={y2} for a clip "
+            f"of size {w}x{h}"
+        )
+
+    if (x1, y1, x2, y2) == (0, 0, w, h) and not copy:
+        return clip
+
+    return clip.image_transform(_Crop(x1, y1, x2, y2, copy), apply_to=["mask"])
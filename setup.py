@@ -88,6 +88,10 @@ optional_reqs = [
     "youtube_dl",
 ]
 
+uring_reqs = [
+    "liburing; sys_platform == 'linux'",
+]
+
 doc_reqs = [
     "numpydoc<2.0",
     "Sphinx==3.4.3",
@@ -113,6 +117,7 @@ lint_reqs = [
 
 extra_reqs = {
     "optional": optional_reqs,
+    "uring": uring_reqs,
     "doc": doc_reqs,
     "test": test_reqs,
     "lint": lint_reqs,
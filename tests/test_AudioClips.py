@@ -3,6 +3,7 @@
 import os
 
 import numpy as np
+import proglog
 
 import pytest
 
@@ -51,6 +52,49 @@ def test_audioclip_io(util):
     assert (output_array[len(input_array) :] == 0).all()
 
 
+def test_audioclip_write_audiofile_min_buffersize(util, mono_wave):
+    filename = os.path.join(util.TMP_DIR, "min_buffersize.wav")
+    audio = AudioClip(mono_wave(440), duration=2, fps=22050)
+    logger = proglog.ProgressBarLogger()
+    audio.write_audiofile(filename, buffersize=100, logger=logger)
+
+    assert "raised from 100 to 2205" in logger.dump_logs()
+    # the clip is written by chunks of 100 ms
+    assert logger.bars["chunk"]["total"] == 21
+
+    # the default buffer size is above the minimum
+    logger = proglog.ProgressBarLogger()
+    audio.write_audiofile(filename, fps=48000, logger=logger)
+    assert "raised" not in logger.dump_logs()
+
+
+@pytest.mark.parametrize("write_logfile", (False, True))
+@pytest.mark.parametrize(
+    "duration",
+    (
+        pytest.param(5, id="buffered"),
+        pytest.param(60, id="written"),
+    ),
+)
+def test_audioclip_write_errors(util, mono_wave, write_logfile, duration):
+    """Checks that ffmpeg errors are reported, either while the chunks are
+    written or, if all the data fits in the buffers, when the writer is closed.
+    """
+    filename = os.path.join(util.TMP_DIR, "audioclip-errors.mp3")
+    audio = AudioClip(mono_wave(440), duration=duration, fps=22050)
+    with pytest.raises(IOError) as exc:
+        audio.write_audiofile(
+            filename,
+            codec="nonexistent-codec",
+            write_logfile=write_logfile,
+            logger=None,
+        )
+    assert (
+        "The audio export failed because FFMPEG didn't find the specified"
+        " codec for audio encoding nonexistent-codec" in str(exc.value)
+    ), exc.value
+
+
 def test_concatenate_audioclips_render(util, mono_wave):
     """Concatenated AudioClips through ``concatenate_audioclips`` should return
     a clip that can be rendered to a file.
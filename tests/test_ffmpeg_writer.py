@@ -1,12 +1,19 @@
 """FFmpeg writer tests of moviepy."""
 
+import gc
 import multiprocessing
 import os
+import sys
+import weakref
 
+import numpy as np
 from PIL import Image
 
 import pytest
 
+from moviepy.audio.AudioClip import AudioArrayClip
+from moviepy.audio.io import ffmpeg_audiowriter
+from moviepy.audio.io.AudioFileClip import AudioFileClip
 from moviepy.video.compositing.concatenate import concatenate_videoclips
 from moviepy.video.io.ffmpeg_writer import ffmpeg_write_image, ffmpeg_write_video
 from moviepy.video.io.gif_writers import write_gif
@@ -256,3 +263,214 @@ def test_write_gif(util, clip_class, opt, loop, with_mask, pixel_format):
         assert b == 255
 
         assert final_clip.duration == (loop or 1) * round(original_clip.duration, 6)
+
+
+@pytest.mark.parametrize("has_writev", (False, True))
+def test_ffmpeg_audiowriter_small_chunks(util, monkeypatch, has_writev):
+    """Small chunks are accumulated before being written to ffmpeg, either in
+    a buffer or with a vectored write.
+    """
+    if has_writev and not hasattr(os, "writev"):
+        pytest.skip("os.writev is not available on this platform")
+    monkeypatch.setattr(ffmpeg_audiowriter, "HAS_WRITEV", has_writev)
+
+    filename = os.path.join(util.TMP_DIR, "small_chunks.wav")
+    input_array = np.random.random((44100, 2)) * 1.98 - 0.99
+    clip = AudioArrayClip(input_array, fps=44100)
+    with ffmpeg_audiowriter.FFMPEG_AudioWriter(
+        filename, 44100, codec="pcm_s16le"
+    ) as writer:
+        for chunk in clip.iter_chunks(chunksize=100, quantize=True):
+            writer.write_frames(chunk)
+
+    output_array = AudioFileClip(filename).to_soundarray()
+    np.testing.assert_array_almost_equal(
+        output_array[: len(input_array)], input_array, decimal=4
+    )
+
+
+@pytest.mark.parametrize("has_writev", (False, True))
+def test_ffmpeg_audiowriter_non_contiguous_chunks(util, monkeypatch, has_writev):
+    """Non contiguous chunks are copied in a buffer reused between chunks."""
+    if has_writev and not hasattr(os, "writev"):
+        pytest.skip("os.writev is not available on this platform")
+    monkeypatch.setattr(ffmpeg_audiowriter, "HAS_WRITEV", has_writev)
+
+    filename = os.path.join(util.TMP_DIR, "non_contiguous.wav")
+    input_array = np.random.random((44100, 4)) * 1.98 - 0.99
+    quantized_array = (2**15 * input_array).astype("int16")
+    with ffmpeg_audiowriter.FFMPEG_AudioWriter(
+        filename, 44100, codec="pcm_s16le"
+    ) as writer:
+        for start in range(0, len(quantized_array), 700):
+            writer.write_frames(quantized_array[start : start + 700, ::2])
+
+    output_array = AudioFileClip(filename).to_soundarray()
+    np.testing.assert_array_almost_equal(
+        output_array[: len(input_array)], input_array[:, ::2], decimal=4
+    )
+
+
+@pytest.mark.parametrize("has_writev", (False, True))
+def test_ffmpeg_audiowriter_reused_array(util, monkeypatch, has_writev):
+    """The writer keeps no reference to the written arrays, so the caller can
+    fill the same array between the calls.
+    """
+    if has_writev and not hasattr(os, "writev"):
+        pytest.skip("os.writev is not available on this platform")
+    monkeypatch.setattr(ffmpeg_audiowriter, "HAS_WRITEV", has_writev)
+
+    filename = os.path.join(util.TMP_DIR, "reused_array.wav")
+    frames = np.empty((4410, 2), dtype="int16")
+    with ffmpeg_audiowriter.FFMPEG_AudioWriter(
+        filename, 44100, codec="pcm_s16le"
+    ) as writer:
+        for i in range(10):
+            frames[:] = i * 100
+            writer.write_frames(frames)
+
+    output_array = AudioFileClip(filename).to_soundarray(quantize=True, nbytes=2)
+    expected_array = np.repeat(np.arange(0, 1000, 100, dtype="int16"), 4410)
+    np.testing.assert_array_equal(output_array[:, 0], expected_array)
+    np.testing.assert_array_equal(output_array[:, 1], expected_array)
+
+
+def test_ffmpeg_audiowriter_uring(util):
+    pytest.importorskip("liburing")
+
+    filename = os.path.join(util.TMP_DIR, "uring.wav")
+    input_array = np.random.random((44100, 2)) * 1.98 - 0.99
+    clip = AudioArrayClip(input_array, fps=44100)
+    with ffmpeg_audiowriter.FFMPEG_AudioWriter(
+        filename, 44100, codec="pcm_s16le", use_uring=True
+    ) as writer:
+        # the writer must not fall back to regular writes
+        assert writer._uring is not None
+        for chunk in clip.iter_chunks(chunksize=1000, quantize=True):
+            writer.write_frames(chunk)
+
+    output_array = AudioFileClip(filename).to_soundarray()
+    np.testing.assert_array_almost_equal(
+        output_array[: len(input_array)], input_array, decimal=4
+    )
+
+
+def test_ffmpeg_audiowriter_uring_unavailable(util, monkeypatch):
+    monkeypatch.setattr(ffmpeg_audiowriter, "liburing", None)
+
+    filename = os.path.join(util.TMP_DIR, "uring-unavailable.wav")
+    with pytest.warns(UserWarning, match="io_uring is not available"):
+        writer = ffmpeg_audiowriter.FFMPEG_AudioWriter(
+            filename, 44100, codec="pcm_s16le", use_uring=True
+        )
+    with writer:
+        writer.write_frames(np.zeros((1000, 2), dtype="int16"))
+    assert os.path.exists(filename)
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Requires named pipes")
+def test_ffmpeg_audiowriter_from_fifo(util):
+    fifo_path = os.path.join(util.TMP_DIR, "audiowriter.fifo")
+    filename = os.path.join(util.TMP_DIR, "from-fifo.wav")
+    if os.path.exists(fifo_path):
+        os.remove(fifo_path)
+
+    frames = np.arange(-22050, 22050, dtype="int16").reshape(-1, 1).repeat(2, 1)
+    writer = ffmpeg_audiowriter.FFMPEG_AudioWriter.from_fifo(
+        fifo_path, filename, 44100, codec="pcm_s16le"
+    )
+    with writer:
+        assert os.path.exists(fifo_path)
+        for start in range(0, len(frames), 4410):
+            writer.write_frames(frames[start : start + 4410])
+    assert not os.path.exists(fifo_path)
+
+    clip = AudioFileClip(filename)
+    assert clip.nchannels == 2
+    assert clip.duration == 1
+    arr = clip.to_soundarray(quantize=True, nbytes=2)
+    assert np.array_equal(arr, frames)
+    clip.close()
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Requires named pipes")
+def test_ffmpeg_audiowriter_from_fifo_errors(util):
+    fifo_path = os.path.join(util.TMP_DIR, "audiowriter-error.fifo")
+    filename = os.path.join(util.TMP_DIR, "from-fifo-error.mp3")
+    if os.path.exists(fifo_path):
+        os.remove(fifo_path)
+
+    # the named pipe is removed even if ffmpeg fails
+    with pytest.raises(IOError, match="Unknown encoder 'nope'"):
+        with ffmpeg_audiowriter.FFMPEG_AudioWriter.from_fifo(
+            fifo_path, filename, 44100, codec="nope"
+        ) as writer:
+            for _ in range(100):
+                writer.write_frames(np.zeros((44100, 2), dtype="int16"))
+    assert not os.path.exists(fifo_path)
+
+    # regular files are not used as named pipes
+    with open(fifo_path, "wb"):
+        pass
+    with pytest.raises(ValueError, match="is not a named pipe"):
+        ffmpeg_audiowriter.FFMPEG_AudioWriter.from_fifo(fifo_path, filename, 44100)
+    assert os.path.exists(fifo_path)
+    os.remove(fifo_path)
+
+
+def test_ffmpeg_audiowriter_unquantized_frames(util):
+    filename = os.path.join(util.TMP_DIR, "unquantized.wav")
+    with ffmpeg_audiowriter.FFMPEG_AudioWriter(
+        filename, 44100, nbytes=2, codec="pcm_s16le"
+    ) as writer:
+        with pytest.raises(AssertionError, match="Expected 2-byte integer frames"):
+            writer.write_frames(np.zeros((1000, 2)))
+        with pytest.raises(AssertionError, match="Expected 2-byte integer frames"):
+            writer.write_frames(np.zeros((1000, 2), dtype="int32"))
+
+
+def test_ffmpeg_audiowriter_verbose_ffmpeg(util):
+    """The ffmpeg output is drained while writing, so an output larger than
+    the stderr pipe does not block ffmpeg, and only its end is kept.
+    """
+    filename = os.path.join(util.TMP_DIR, "verbose.mp3")
+    with ffmpeg_audiowriter.FFMPEG_AudioWriter(
+        filename, 44100, codec="libmp3lame", ffmpeg_params=["-loglevel", "trace"]
+    ) as writer:
+        for _ in range(300):
+            writer.write_frames(np.zeros((4410, 2), dtype="int16"))
+        stderr_data = writer._stderr_data
+
+    assert len(stderr_data) == ffmpeg_audiowriter.MAX_STDERR_SIZE
+    assert os.path.exists(filename)
+
+
+def test_ffmpeg_audiowriter_garbage_collected(util):
+    """A writer dropped without being closed is collected, which closes it."""
+    filename = os.path.join(util.TMP_DIR, "dropped.wav")
+    writer = ffmpeg_audiowriter.FFMPEG_AudioWriter(filename, 44100, codec="pcm_s16le")
+    writer.write_frames(np.zeros((1000, 2), dtype="int16"))
+    proc, writer_ref = writer.proc, weakref.ref(writer)
+
+    del writer
+    gc.collect()
+
+    assert writer_ref() is None
+    assert proc.poll() == 0
+
+
+def test_ffmpeg_audiowriter_garbage_collected_error(util, monkeypatch):
+    """The ffmpeg errors are only raised by explicit calls to ``close``."""
+    unraisable_exceptions = []
+    monkeypatch.setattr(sys, "unraisablehook", unraisable_exceptions.append)
+
+    filename = os.path.join(util.TMP_DIR, "dropped-error.mp3")
+    writer = ffmpeg_audiowriter.FFMPEG_AudioWriter(filename, 44100, codec="nope")
+    writer.write_frames(np.zeros((1000, 2), dtype="int16"))
+    proc = writer.proc
+
+    del writer
+    gc.collect()
+
+    assert proc.returncode != 0
+    assert not unraisable_exceptions
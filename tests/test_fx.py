@@ -5,6 +5,7 @@ import importlib
 import math
 import numbers
 import os
+import pickle
 import random
 import sys
 
@@ -53,6 +54,7 @@ from moviepy.video.fx import (
     time_mirror,
     time_symmetrize,
 )
+from moviepy.video.fx.crop import _Crop
 
 
 def test_accel_decel():
@@ -151,6 +153,7 @@ def test_crop():
     clip1 = crop(clip)
     target1 = BitmapClip([["ABCDE", "EDCBA", "CDEAB", "BAEDC"]], fps=1)
     assert clip1 == target1
+    assert clip1 is clip  # nothing to crop
 
     clip2 = crop(clip, x1=1, y1=1, x2=3, y2=3)
     target2 = BitmapClip([["DC", "DE"]], fps=1)
@@ -164,7 +167,6 @@ def test_crop():
     target4 = BitmapClip([["CD", "CB", "EA", "ED"]], fps=1)
     assert clip4 == target4
 
-    # TODO x_center=1 does not perform correctly
     clip5 = crop(clip, x_center=2, y_center=2, width=3, height=3)
     target5 = BitmapClip([["ABC", "EDC", "CDE"]], fps=1)
     assert clip5 == target5
@@ -174,6 +176,45 @@ def test_crop():
     assert clip6 == target6
 
 
+def test_crop_bounds():
+    clip = BitmapClip([["ABCDE", "EDCBA", "CDEAB", "BAEDC"]], fps=1)
+
+    # the parts of the rectangle outside of the frame are ignored
+    clip1 = crop(clip, x_center=1, width=4, y1=2, y2=10)
+    target1 = BitmapClip([["CDE", "BAE"]], fps=1)
+    assert clip1 == target1
+
+    # explicit negative coordinates count from the end
+    clip2 = crop(clip, x1=-2, y2=-2)
+    target2 = BitmapClip([["DE", "BA"]], fps=1)
+    assert clip2 == target2
+    clip3 = crop(clip, x2=-1, width=2, y1=-1)
+    target3 = BitmapClip([["ED"]], fps=1)
+    assert clip3 == target3
+
+    with pytest.raises(ValueError, match="Empty crop rectangle"):
+        crop(clip, x1=3, x2=3)
+    with pytest.raises(ValueError, match="Empty crop rectangle"):
+        crop(clip, y1=5)
+
+
+def test_crop_copy():
+    clip = BitmapClip([["ABCDE", "EDCBA", "CDEAB", "BAEDC"]], fps=1)
+
+    view_frame = crop(clip, x1=1, y1=1, x2=3, y2=3).get_frame(0)
+    assert not view_frame.flags["C_CONTIGUOUS"]
+
+    copy_clip = crop(clip, x1=1, y1=1, x2=3, y2=3, copy=True)
+    assert copy_clip.get_frame(0).flags["C_CONTIGUOUS"]
+    assert copy_clip == BitmapClip([["DC", "DE"]], fps=1)
+
+
+def test_crop_pickle():
+    frame = np.arange(20).reshape((4, 5))
+    crop_frame = pickle.loads(pickle.dumps(_Crop(1, 1, 3, 3, False)))
+    np.testing.assert_array_equal(crop_frame(frame), frame[1:3, 1:3])
+
+
 def test_even_size():
     clip1 = BitmapClip([["ABC", "BCD"]], fps=1)  # Width odd
     clip1even = even_size(clip1)